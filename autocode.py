@@ -21,6 +21,13 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
+# uvloop is optional - when installed it replaces the default event loop with
+# a much faster implementation (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from agent import run_autonomous_agent
 from subscription import api_key
 
@@ -118,6 +125,8 @@ def main() -> None:
             project_dir = Path("generations") / project_dir
 
     # Run the agent
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(
             run_autonomous_agent(
@@ -20,7 +20,9 @@ class BaseClient(ABC):
     - receive_response(): Stream responses from the agent
     - Context manager support for resource cleanup
     """
-    
+
+    __slots__ = ()
+
     @abstractmethod
     async def query(self, message: str) -> None:
         """
@@ -36,17 +38,19 @@ class BaseClient(ABC):
         pass
     
     @abstractmethod
-    async def receive_response(self) -> AsyncGenerator[Any, None]:
+    def receive_response(self) -> AsyncGenerator[Any, None]:
         """
         Stream responses from the AI agent.
-        
-        Yields:
-            Response messages from the agent. The exact type depends on
-            the implementation (e.g., SDK message objects, parsed events).
-            
+
+        Returns:
+            An async iterable of response messages from the agent. The exact
+            message type depends on the implementation (e.g., SDK message
+            objects, parsed events).
+
         Note:
-            This is an async generator that yields responses as they
-            become available from the agent.
+            Implementations may be async generator functions or plain methods
+            returning an underlying async generator - the latter avoids an
+            extra re-yield per message.
         """
         pass
     
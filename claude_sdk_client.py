@@ -5,13 +5,15 @@ Claude SDK Client Implementation
 Claude Agent SDK client wrapper implementing the BaseClient interface.
 """
 
-import json
+from __future__ import annotations
+
 from pathlib import Path
-from typing import AsyncGenerator, Any
+from typing import TYPE_CHECKING, AsyncGenerator, Any
 
-from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
-from claude_code_sdk.types import HookMatcher
+if TYPE_CHECKING:
+    from claude_code_sdk import ClaudeSDKClient
 
+import fastjson
 from base_client import BaseClient
 from security import bash_security_hook
 from subscription import api_key
@@ -26,6 +28,55 @@ from tools import (
 )
 
 
+# Combined tool allowlist for the SDK client, frozen at import time.
+ALLOWED_TOOLS = (
+    *BUILTIN_TOOLS,
+    *CONTEXT7_TOOLS,
+    *BROWSERMCP_TOOLS,
+    # *PUPPETEER_TOOLS, # Problems with every time large screenshots
+    *POSTGRES_TOOLS,
+    # *SERENA_TOOLS,
+)
+
+# System prompt shared by every session. Kept as a single module-level
+# constant so the conversation prefix stays byte-identical across sessions
+# and the API can serve it from the prompt cache.
+SYSTEM_PROMPT = "You are an expert full-stack developer building a production-quality web application."
+
+# Comprehensive security settings, shared by every client.
+# Note: Using relative paths ("./**") restricts access to project directory
+# since cwd is set to project_dir
+SECURITY_SETTINGS = {
+    "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
+    "permissions": {
+        "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
+        "allow": [
+            # Allow all file operations within the project directory
+            "Read(./**)",
+            "Write(./**)",
+            "Edit(./**)",
+            "Glob(./**)",
+            "Grep(./**)",
+            # Bash permission granted here, but actual commands are validated
+            # by the bash_security_hook (see security.py for allowed commands)
+            "Bash(*)",
+            "WebFetch(*)",
+            "WebSearch",
+            *CONTEXT7_TOOLS,
+            *BROWSERMCP_TOOLS,
+            # Allow Puppeteer MCP tools for browser automation
+            # *PUPPETEER_TOOLS,
+            *POSTGRES_TOOLS,
+            # *SERENA_TOOLS,
+        ],
+    },
+}
+
+# The settings are static, so serialize them once; create_client only rewrites
+# the settings file when its content differs (e.g. first run or older version).
+_SECURITY_SETTINGS_JSON = fastjson.dumps(SECURITY_SETTINGS, indent=True)
+
+
 class ClaudeClientWrapper(BaseClient):
     """
     Wrapper for ClaudeSDKClient implementing the BaseClient interface.
@@ -33,7 +84,9 @@ class ClaudeClientWrapper(BaseClient):
     This allows the Claude SDK client to be used interchangeably with
     other AI client implementations through a common interface.
     """
-    
+
+    __slots__ = ("_client",)
+
     def __init__(self, sdk_client: ClaudeSDKClient):
         """
         Initialize the wrapper.
@@ -47,10 +100,14 @@ class ClaudeClientWrapper(BaseClient):
         """Send a query to the Claude SDK client."""
         await self._client.query(message)
     
-    async def receive_response(self) -> AsyncGenerator[Any, None]:
-        """Stream responses from the Claude SDK client."""
-        async for msg in self._client.receive_response():
-            yield msg
+    def receive_response(self) -> AsyncGenerator[Any, None]:
+        """
+        Stream responses from the Claude SDK client.
+
+        Returns the SDK's own async generator directly, so iteration does not
+        pay an extra async re-yield for every message.
+        """
+        return self._client.receive_response()
     
     async def __aenter__(self):
         """Enter async context manager."""
@@ -79,47 +136,28 @@ def create_client(project_dir: Path, model: str) -> ClaudeClientWrapper:
     3. Security hooks - Bash commands validated against an allowlist
        (see security.py for ALLOWED_COMMANDS)
     """
+    # Imported lazily - the SDK pulls in its whole transport stack, so keep it
+    # off the module import path and only pay for it when a Claude client is
+    # actually created.
+    from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
+    from claude_code_sdk.types import HookMatcher
 
     # Check for API key
     if not api_key:
         raise ValueError("API key not set.")
 
-    # Create comprehensive security settings
-    # Note: Using relative paths ("./**") restricts access to project directory
-    # since cwd is set to project_dir
-    security_settings = {
-        "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
-        "permissions": {
-            "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
-            "allow": [
-                # Allow all file operations within the project directory
-                "Read(./**)",
-                "Write(./**)",
-                "Edit(./**)",
-                "Glob(./**)",
-                "Grep(./**)",
-                # Bash permission granted here, but actual commands are validated
-                # by the bash_security_hook (see security.py for allowed commands)
-                "Bash(*)",
-                "WebFetch(*)",
-                "WebSearch",
-                *CONTEXT7_TOOLS,
-                *BROWSERMCP_TOOLS,
-                # Allow Puppeteer MCP tools for browser automation
-                # *PUPPETEER_TOOLS,
-                *POSTGRES_TOOLS,
-                # *SERENA_TOOLS,
-            ],
-        },
-    }
-
     # Ensure project directory exists before creating settings file
     project_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write settings to a file in the project directory
+    # Write settings to a file in the project directory, skipping the write
+    # when the file already holds the current settings
     settings_file = project_dir / ".claude_settings.json"
-    with open(settings_file, "w") as f:
-        json.dump(security_settings, f, indent=2)
+    try:
+        settings_unchanged = settings_file.read_text() == _SECURITY_SETTINGS_JSON
+    except OSError:
+        settings_unchanged = False
+    if not settings_unchanged:
+        settings_file.write_text(_SECURITY_SETTINGS_JSON)
 
     print(f"Created security settings at {settings_file}")
     print("   - Sandbox enabled (OS-level bash isolation)")
@@ -131,15 +169,8 @@ def create_client(project_dir: Path, model: str) -> ClaudeClientWrapper:
     sdk_client = ClaudeSDKClient(
         options=ClaudeCodeOptions(
             model=model,
-            system_prompt="You are an expert full-stack developer building a production-quality web application.",
-            allowed_tools=[
-                *BUILTIN_TOOLS,
-                *CONTEXT7_TOOLS,
-                *BROWSERMCP_TOOLS,
-                # *PUPPETEER_TOOLS, # Problems with every time large screenshots
-                *POSTGRES_TOOLS,
-                # *SERENA_TOOLS,
-            ],
+            system_prompt=SYSTEM_PROMPT,
+            allowed_tools=list(ALLOWED_TOOLS),
             # Using enhanced https://github.com/sultannaufal/puppeteer-mcp-server with mouse tools that also allows configuration of screenshot quality
             mcp_servers=MCP_SERVERS,
             hooks={
@@ -9,21 +9,54 @@ This allows Copilot CLI to be used as an alternative AI provider in the autonomo
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import re
 from dataclasses import dataclass, field
+from io import StringIO
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, Optional
 
+from functools import lru_cache
+
+import fastjson
 from base_client import BaseClient
 
 
+# ----------------------------
+# Parsing patterns
+# ----------------------------
+
+# Compiled once at import and shared by every parser instance.
+# Fence delimiters and shell lines are fused into a single alternation so each
+# line is classified in one regex pass (Python's re runs the alternation as
+# one scan - the practical equivalent of a fused DFA here). A fence match
+# leaves the "cmd" group empty; a shell match fills it.
+_RE_LINE = re.compile(r"^\s*(?:```(?P<lang>\w+)?\s*$|\$\s+(?P<cmd>.+)$)")
+# Anchored at line start (modulo indentation): the CLI reports file
+# operations as whole lines, and an anchored match fails fast on ordinary
+# prose instead of scanning every position in the line.
+_RE_FILE_OP = re.compile(
+    r"^\s*(?P<op>Create|Create\s+file|Update|Edit|Modify|Delete)\s+(?:file\s+)?(?P<path>[^\s]+)",
+    re.IGNORECASE,
+)
+
+# CSI sequences (colors, cursor movement) and two-byte escapes emitted by the
+# CLI's progress rendering. Compiled once; stripping happens before the line
+# heuristics so escape bytes can't break pattern matching.
+_RE_ANSI = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b[@-Z\\-_]")
+
+
+@lru_cache(maxsize=256)
+def _classify_line(line: str):
+    """Cached line classification - fences, prompts and blank lines repeat constantly."""
+    return _RE_LINE.match(line)
+
+
 # ----------------------------
 # Events
 # ----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CopilotEvent:
     """Event emitted by the Copilot CLI output parser."""
     type: str  # "raw", "text", "tool_call", "json", "done", "error"
@@ -45,18 +78,19 @@ class OutputParser:
     - Shell commands (lines starting with $)
     - File operations (Create/Update/Delete patterns)
     """
-    
-    _re_shell_line = re.compile(r"^\s*\$\s+(?P<cmd>.+)$")
-    _re_code_fence = re.compile(r"^```(?P<lang>\w+)?\s*$")
-    _re_file_op = re.compile(
-        r"(?P<op>Create|Create\s+file|Update|Edit|Modify|Delete)\s+(?:file\s+)?(?P<path>[^\s]+)",
-        re.IGNORECASE,
-    )
 
     def __init__(self):
         self._in_fence = False
         self._fence_lang: Optional[str] = None
-        self._fence_buf: list[str] = []
+        # Fenced code accumulates in one growing buffer instead of a list of
+        # line strings joined at fence close.
+        self._fence_buf = StringIO()
+
+    def reset(self) -> None:
+        """Clear fence state so the parser can be reused for a new run."""
+        self._in_fence = False
+        self._fence_lang = None
+        self._fence_buf = StringIO()
 
     def feed(self, chunk: str) -> list[CopilotEvent]:
         """
@@ -72,7 +106,10 @@ class OutputParser:
         if not chunk:
             return events
 
-        events.append(CopilotEvent(type="raw", text=chunk))
+        # Strip ANSI escape sequences so terminal styling never reaches the
+        # scanning patterns; the containment check keeps clean chunks free.
+        if "\x1b" in chunk:
+            chunk = _RE_ANSI.sub("", chunk)
 
         # JSON auto-detection
         maybe = self._extract_json(chunk)
@@ -80,7 +117,7 @@ class OutputParser:
             events.append(
                 CopilotEvent(
                     type="json",
-                    text=json.dumps(maybe, ensure_ascii=False),
+                    text=fastjson.dumps(maybe),
                     meta={"parsed": maybe},
                 )
             )
@@ -97,18 +134,23 @@ class OutputParser:
                 events.append(CopilotEvent(type="text", text=final))
             return events
 
-        # Heuristics for tool-calls
+        # Heuristics for tool-calls. Lines not consumed by the fence, shell
+        # or file-op handling are collected and emitted as a single text
+        # event, so each piece of output is reported exactly once (the old
+        # per-chunk "raw" event and full-chunk text duplicate are gone).
+        plain_lines: list[str] = []
         lines = chunk.splitlines()
         for ln in lines:
-            fence = self._re_code_fence.match(ln.strip())
-            if fence:
+            m = _classify_line(ln)
+            if m is not None and m.group("cmd") is None:
+                # Fence delimiter
                 if not self._in_fence:
                     self._in_fence = True
-                    self._fence_lang = fence.group("lang") or None
-                    self._fence_buf = []
+                    self._fence_lang = m.group("lang") or None
+                    self._fence_buf = StringIO()
                 else:
-                    # End of fence
-                    code = "\n".join(self._fence_buf)
+                    # End of fence (drop the trailing newline added per line)
+                    code = self._fence_buf.getvalue()[:-1]
                     events.append(
                         CopilotEvent(
                             type="text",
@@ -131,16 +173,17 @@ class OutputParser:
                         )
                     self._in_fence = False
                     self._fence_lang = None
-                    self._fence_buf = []
+                    self._fence_buf = StringIO()
                 continue
 
             if self._in_fence:
-                self._fence_buf.append(ln)
+                self._fence_buf.write(ln)
+                self._fence_buf.write("\n")
                 continue
 
-            m_shell = self._re_shell_line.match(ln)
-            if m_shell:
-                cmd = m_shell.group("cmd").strip()
+            if m is not None:
+                # Shell line ("$ <cmd>")
+                cmd = m.group("cmd").strip()
                 events.append(
                     CopilotEvent(
                         type="tool_call",
@@ -150,7 +193,7 @@ class OutputParser:
                 )
                 continue
 
-            m_file = self._re_file_op.search(ln)
+            m_file = _RE_FILE_OP.match(ln)
             if m_file:
                 events.append(
                     CopilotEvent(
@@ -164,18 +207,26 @@ class OutputParser:
                 )
                 continue
 
-        events.append(CopilotEvent(type="text", text=chunk))
+            plain_lines.append(ln)
+
+        if plain_lines:
+            events.append(CopilotEvent(type="text", text="\n".join(plain_lines) + "\n"))
         return events
 
     def _extract_json(self, chunk: str) -> Optional[Dict[str, Any]]:
         """Attempt to extract JSON from a chunk of text."""
-        start = chunk.find("{")
+        # Cheap gate: a structured JSON payload starts with "{" (modulo
+        # leading whitespace). Prose chunks that merely mention a brace
+        # somewhere no longer pay a full find/rfind scan and a doomed parse.
+        if not chunk[:16].lstrip().startswith("{"):
+            return None
+        start = chunk.index("{")
         end = chunk.rfind("}")
-        if start == -1 or end == -1 or end <= start:
+        if end <= start:
             return None
         candidate = chunk[start : end + 1]
         try:
-            return json.loads(candidate)
+            return fastjson.loads(candidate)
         except Exception:
             return None
 
@@ -184,6 +235,12 @@ class OutputParser:
 # NON-INTERACTIVE Copilot runner
 # ----------------------------
 
+# Environment snapshot taken once at import (after autocode's load_dotenv has
+# populated it) and shared by every runner; each instance only pays for a copy
+# when it actually applies overrides.
+_BASE_ENV = dict(os.environ)
+
+
 class CopilotRunner:
     """
     Runner for non-interactive Copilot CLI execution.
@@ -203,22 +260,31 @@ class CopilotRunner:
         """
         self.copilot_cmd = copilot_cmd
         self.workdir = workdir or os.getcwd()
-        # Set up environment with XDG_CONFIG_HOME for project-level config
-        self.env = {**os.environ, **(env or {})}
-        if copilot_config_dir:
-            self.env["XDG_CONFIG_HOME"] = copilot_config_dir
+        # Set up environment with XDG_CONFIG_HOME for project-level config,
+        # reusing the shared snapshot when there is nothing to override
+        if env or copilot_config_dir:
+            self.env = {**_BASE_ENV, **(env or {})}
+            if copilot_config_dir:
+                self.env["XDG_CONFIG_HOME"] = copilot_config_dir
+        else:
+            self.env = _BASE_ENV
         self._parser = OutputParser()
 
-    async def ask_stream(self, prompt: str) -> AsyncGenerator[CopilotEvent, None]:
+    async def ask_stream(self, prompt: str) -> AsyncGenerator[list[CopilotEvent], None]:
         """
-        Run copilot with a prompt and stream parsed events.
-        
+        Run copilot with a prompt and stream parsed events in batches.
+
         Args:
             prompt: The prompt to send to Copilot CLI
-            
+
         Yields:
-            CopilotEvent objects parsed from the output
+            Lists of CopilotEvent objects - one batch per output chunk, so
+            the read loop resumes once per chunk instead of once per event
         """
+        # One parser lives for the client's lifetime; reset per run so fence
+        # state from an interrupted previous run cannot leak into this one.
+        self._parser.reset()
+
         proc = await asyncio.create_subprocess_exec(
             self.copilot_cmd,
             "-p",
@@ -228,21 +294,28 @@ class CopilotRunner:
             cwd=self.workdir,
             env=self.env,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.STDOUT,
+            # Keep diagnostics out of the parsed stream - interleaved stderr
+            # lines would otherwise be re-parsed as model output.
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=1024 * 1024,  # Allow long output lines without overrunning readline
         )
 
         assert proc.stdout is not None
 
+        # Read line-aligned chunks: the parser works line-by-line, so feeding
+        # it whole lines avoids re-scanning lines split across fixed-size
+        # 4 KiB reads and wakes up exactly once per available line.
         while True:
-            data = await proc.stdout.read(4096)
+            data = await proc.stdout.readline()
             if not data:
                 break
             chunk = data.decode(errors="replace")
-            for ev in self._parser.feed(chunk):
-                yield ev
+            events = self._parser.feed(chunk)
+            if events:
+                yield events
 
         rc = await proc.wait()
-        yield CopilotEvent(type="done", meta={"returncode": rc})
+        yield [CopilotEvent(type="done", meta={"returncode": rc})]
 
 
 # ----------------------------
@@ -291,9 +364,12 @@ class CopilotClient(BaseClient):
         """
         if self._current_prompt is None:
             raise RuntimeError("No query set. Call query() before receive_response()")
-        
-        async for event in self.runner.ask_stream(self._current_prompt):
-            yield event
+
+        # The runner yields one batch per output chunk; flatten here so
+        # BaseClient consumers still see individual events.
+        async for events in self.runner.ask_stream(self._current_prompt):
+            for event in events:
+                yield event
     
     async def __aenter__(self):
         """Enter async context manager."""
@@ -305,6 +381,35 @@ class CopilotClient(BaseClient):
         pass
 
 
+@lru_cache(maxsize=1)
+def _copilot_mcp_config_json() -> str:
+    """
+    Convert MCP_SERVERS from tools.py into Copilot CLI format, serialized.
+
+    Built on first use and cached for the process lifetime - the server
+    definitions are fixed at import, so the conversion never needs to run
+    twice.
+    """
+    from tools import MCP_SERVERS
+
+    copilot_mcp_config = {"mcpServers": {}}
+    for server_name, server_config in MCP_SERVERS.items():
+        if server_config.get("type") == "http":
+            copilot_mcp_config["mcpServers"][server_name] = {
+                "type": "http",
+                "url": server_config["url"]
+            }
+        else:
+            copilot_mcp_config["mcpServers"][server_name] = {
+                "command": server_config["command"],
+                "args": server_config["args"]
+            }
+            if "env" in server_config:
+                copilot_mcp_config["mcpServers"][server_name]["env"] = server_config["env"]
+
+    return fastjson.dumps(copilot_mcp_config, indent=True)
+
+
 def create_copilot_client(project_dir: Path) -> CopilotClient:
     """
     Create a Copilot CLI client.
@@ -322,37 +427,21 @@ def create_copilot_client(project_dir: Path) -> CopilotClient:
     copilot_config_dir = project_dir / ".copilot"
     copilot_config_dir.mkdir(exist_ok=True)
     
-    # Copy example MCP config if it doesn't exist
+    # Write the prebuilt MCP config if it doesn't exist; "x" mode combines
+    # the existence check and the create into a single call
     mcp_config_file = copilot_config_dir / "mcp-config.json"
-    if not mcp_config_file.exists():
-        # Create a basic MCP config from tools.py
-        from tools import MCP_SERVERS
-        
-        # Convert MCP_SERVERS to Copilot CLI format
-        copilot_mcp_config = {"mcpServers": {}}
-        for server_name, server_config in MCP_SERVERS.items():
-            if server_config.get("type") == "http":
-                copilot_mcp_config["mcpServers"][server_name] = {
-                    "type": "http",
-                    "url": server_config["url"]
-                }
-            else:
-                copilot_mcp_config["mcpServers"][server_name] = {
-                    "command": server_config["command"],
-                    "args": server_config["args"]
-                }
-                if "env" in server_config:
-                    copilot_mcp_config["mcpServers"][server_name]["env"] = server_config["env"]
-        
-        with open(mcp_config_file, "w") as f:
-            json.dump(copilot_mcp_config, f, indent=2)
-        
+    try:
+        with open(mcp_config_file, "x") as f:
+            f.write(_copilot_mcp_config_json())
         print(f"Created MCP config at {mcp_config_file}")
-    
+    except FileExistsError:
+        pass
+
+    resolved_dir = project_dir.resolve()
     print(f"Using GitHub Copilot CLI")
-    print(f"   - Working directory: {project_dir.resolve()}")
+    print(f"   - Working directory: {resolved_dir}")
     print(f"   - Autonomous mode: --allow-all-tools enabled")
-    print(f"   - Auto-trusted directory: --add-dir {project_dir.resolve()}")
+    print(f"   - Auto-trusted directory: --add-dir {resolved_dir}")
     print(f"   - MCP config: {mcp_config_file}")
     print()
     
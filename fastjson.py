@@ -0,0 +1,32 @@
+"""
+Fast JSON Helpers
+=================
+
+Thin wrapper around orjson with a stdlib json fallback. orjson parses and
+serializes significantly faster than the stdlib, but it is an optional
+dependency - when it is not installed these helpers behave like the stdlib
+equivalents, so callers can always catch json.JSONDecodeError.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to stdlib json
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from a str or bytes object."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, optionally indented for readability."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    # ensure_ascii=False matches orjson's output, keeping both paths consistent
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
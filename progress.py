@@ -6,8 +6,32 @@ Functions for tracking and displaying progress of the autonomous coding agent.
 """
 
 import json
+import sys
 from pathlib import Path
 
+import fastjson
+
+
+# Parsed feature_list.json cache keyed by (mtime_ns, size) per path. Progress
+# is reported several times per session while the file only changes when the
+# agent edits it, so unchanged files skip the re-parse.
+_feature_list_cache: dict[Path, tuple[tuple[int, int], list]] = {}
+
+
+def _load_feature_list(tests_file: Path) -> list:
+    """
+    Parse feature_list.json, reusing the cached parse while the file's
+    mtime and size are unchanged. Raises like the underlying read/parse.
+    """
+    stat = tests_file.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _feature_list_cache.get(tests_file)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    tests = fastjson.loads(tests_file.read_bytes())
+    _feature_list_cache[tests_file] = (key, tests)
+    return tests
+
 
 def count_passing_tests(project_dir: Path) -> tuple[int, int]:
     """
@@ -25,11 +49,16 @@ def count_passing_tests(project_dir: Path) -> tuple[int, int]:
         return 0, 0
 
     try:
-        with open(tests_file, "r") as f:
-            tests = json.load(f)
+        tests = _load_feature_list(tests_file)
 
         total = len(tests)
-        passing = sum(1 for test in tests if test.get("passes", False))
+
+        # Single flat pass without a generator frame; the isinstance filter
+        # keeps malformed (non-object) entries from counting as passing.
+        passing = 0
+        for test in tests:
+            if isinstance(test, dict) and test.get("passes", False):
+                passing += 1
 
         return passing, total
     except (json.JSONDecodeError, IOError):
@@ -54,39 +83,37 @@ def is_work_complete(project_dir: Path) -> bool:
         return False
     
     try:
-        with open(tests_file, "r") as f:
-            tests = json.load(f)
-        
-        total = len(tests)
-        passing = sum(1 for test in tests if test.get("passes", False))
-        
+        tests = _load_feature_list(tests_file)
+
         # If feature list is empty, there's no work to do - consider it complete
-        if total == 0:
+        if not tests:
             return True
-        
-        # Work is complete when all tests pass
-        return passing == total
+
+        # Work is complete when all tests pass - bail out on the first
+        # failing feature instead of counting the whole list
+        for test in tests:
+            if not (isinstance(test, dict) and test.get("passes", False)):
+                return False
+        return True
     except (json.JSONDecodeError, IOError):
         # If file is corrupted, work is not complete
         return False
 
 
 def print_session_header(session_num: int, is_initializer: bool) -> None:
-    """Print a formatted header for the session."""
+    """Print a formatted header for the session (one buffered write)."""
     session_type = "INITIALIZER" if is_initializer else "CODING AGENT"
+    bar = "=" * 70
 
-    print("\n" + "=" * 70)
-    print(f"  SESSION {session_num}: {session_type}")
-    print("=" * 70)
-    print()
+    sys.stdout.write(f"\n{bar}\n  SESSION {session_num}: {session_type}\n{bar}\n\n")
 
 
 def print_progress_summary(project_dir: Path) -> None:
-    """Print a summary of current progress."""
+    """Print a summary of current progress (one buffered write)."""
     passing, total = count_passing_tests(project_dir)
 
     if total > 0:
         percentage = (passing / total) * 100
-        print(f"\nProgress: {passing}/{total} tests passing ({percentage:.1f}%)")
+        sys.stdout.write(f"\nProgress: {passing}/{total} tests passing ({percentage:.1f}%)\n")
     else:
-        print("\nProgress: feature_list.json not yet created")
+        sys.stdout.write("\nProgress: feature_list.json not yet created\n")
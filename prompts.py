@@ -6,14 +6,16 @@ Functions for loading prompt templates from the prompts directory.
 """
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (cached per name)."""
     prompt_path = PROMPTS_DIR / f"{name}.md"
     return prompt_path.read_text()
 
@@ -47,13 +49,14 @@ def copy_or_verify_spec(project_dir: Path) -> None:
     spec_dest = project_dir / "app_spec.txt"
     if spec_dest.exists():
         print("Using existing app_spec.txt in project directory")
-    else:
-        spec_source = PROMPTS_DIR / "app_spec.txt"
-        if spec_source.exists():
-            shutil.copy(spec_source, spec_dest)
-            print("Copied app_spec.txt to project directory")
-        else:
-            raise FileNotFoundError(
-                "No app_spec.txt found. Please create one in the project directory "
-                "describing the features you want to add."
-            )
+        return
+    # Attempt the copy directly instead of stat-ing the source first
+    spec_source = PROMPTS_DIR / "app_spec.txt"
+    try:
+        shutil.copy(spec_source, spec_dest)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            "No app_spec.txt found. Please create one in the project directory "
+            "describing the features you want to add."
+        ) from None
+    print("Copied app_spec.txt to project directory")